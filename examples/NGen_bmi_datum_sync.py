@@ -3,6 +3,8 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pcsv
 
 # ------------------------------------------------------
 # Set up paths and environment
@@ -48,24 +50,28 @@ elev_keys = ["z", "elev", "elevation"]
 
 def find_column(columns: list[str], keys: list[str]) -> str | None:
     """Return the first column name that matches any of the specified keys."""
-    for key in keys:
-        for col in columns:
-            if key in col.lower():
-                return col
-    return None
+    # lowercase each column once rather than once per key
+    lowered = [(col, col.lower()) for col in columns]
+    return next((col for key in keys for col, col_lower in lowered if key in col_lower), None)
 
 
 # ------------------------------------------------------
-# Process each file
+# Read each file and standardize coordinate columns
 # ------------------------------------------------------
 
-for input_path, output_path in zip(input_files, output_files, strict=False):
-    df = pd.read_csv(input_path)
+# file_id -> (original DataFrame, original coordinate column names)
+originals = {}
+# coordinate columns -> standardized DataFrames sharing that layout
+batches: dict[tuple[str, ...], list[pd.DataFrame]] = {}
+
+for file_id, input_path in enumerate(input_files):
+    # pyarrow's multithreaded reader infers column types in C++
+    table = pcsv.read_csv(input_path)
 
     # Identify coordinate columns
-    lat_col = find_column(df.columns, lat_keys)
-    lon_col = find_column(df.columns, lon_keys)
-    elev_col = find_column(df.columns, elev_keys)
+    lat_col = find_column(table.column_names, lat_keys)
+    lon_col = find_column(table.column_names, lon_keys)
+    elev_col = find_column(table.column_names, elev_keys)
 
     if not (lat_col and lon_col):
         raise ValueError(f"{input_path}: CSV must contain at least latitude and longitude columns.")
@@ -73,35 +79,50 @@ for input_path, output_path in zip(input_files, output_files, strict=False):
     # Build list of coordinate columns
     use_cols = [lon_col, lat_col] + ([elev_col] if elev_col else [])
 
+    # Arrow-backed columns avoid converting the table into NumPy object blocks
+    df = table.to_pandas(types_mapper=pd.ArrowDtype)
+
     # Create a filtered and standardized DataFrame with consistent column names
     df_filtered = df[use_cols].rename(
         columns={lat_col: "latitude", lon_col: "longitude", **({elev_col: "elevation"} if elev_col else {})}
     )
 
+    originals[file_id] = (df, use_cols)
+    batches.setdefault(tuple(df_filtered.columns), []).append(df_filtered.assign(file_id=file_id))
+
+# ------------------------------------------------------
+# Transform all files with one update per coordinate layout
+# ------------------------------------------------------
+
+for coord_cols, frames in batches.items():
+    batch = pd.concat(frames, ignore_index=True)
+
     # Set model input values
-    for col in df_filtered.columns:
-        model.set_value(col, df_filtered[col].tolist())
+    model.set_coordinates(batch[list(coord_cols)].to_numpy(dtype=np.float64))
     model.update()
 
     # Retrieve model output
-    n_rows, n_cols = df_filtered.shape
+    n_rows, n_cols = len(batch), len(coord_cols)
     dest_array = np.zeros(n_rows * n_cols)
     model.get_value("coordinates__output", dest_array)
 
-    df_model_out = pd.DataFrame(dest_array.reshape((n_rows, n_cols), order="F"), columns=df_filtered.columns)
+    out2d = dest_array.reshape((n_rows, n_cols))
+
+    # Split the batch back into the original files
+    for file_id, rows in batch.groupby("file_id", sort=False).indices.items():
+        df, use_cols = originals[file_id]
 
-    # Append all original non-coordinate metadata columns
-    metadata_cols = df.drop(columns=use_cols, errors="ignore")
-    df_final_out = pd.concat([df_model_out, metadata_cols], axis=1)
+        # Overwrite the coordinate columns in place; metadata columns and ordering are untouched
+        df[use_cols] = out2d[rows]
 
-    # Save the result to output CSV
-    df_final_out.to_csv(output_path, index=False)
+        # Save the result to output CSV; pyarrow's writer is a threaded C++ encoder
+        pcsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), output_files[file_id])
 
-    # Optionally retrieve CRS value (not used further here)
-    crs_array = np.zeros(1)
-    model.get_value("crs_in", crs_array)
+        print(f"Finished processing: {input_files[file_id]}")
 
-    print(f"Finished processing: {input_path}")
+# Optionally retrieve CRS value (not used further here)
+crs_array = np.zeros(1)
+model.get_value("crs_in", crs_array)
 
 # ------------------------------------------------------
 # Finalize the model
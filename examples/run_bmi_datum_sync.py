@@ -2,6 +2,8 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pcsv
 
 from datum_sync.bmi.bmi_datum_sync import BmiDatumSync
 
@@ -22,24 +24,22 @@ print("Getting input data")
 list_data = [data_path / "sample_data_1.csv", data_path / "sample_data_2.csv"]
 list_output = [data_path / "sample_output_1.csv", data_path / "sample_output_2.csv"]
 
+# Typed schema for the coordinate columns so pyarrow skips type inference
+convert_options = pcsv.ConvertOptions(
+    column_types={name: pa.float64() for name in ["longitude", "latitude", "elevation"]}
+)
+
 # Now loop through csvs, update model, save output. 'sequence' of model updates is your file list.
 print("Set values & update model")
 for data, output in zip(list_data, list_output, strict=False):
-    # read values from csv to update model
-    df = pd.read_csv(data)
-
-    # 3D
-    if df.columns.tolist() == ["longitude", "latitude", "elevation"]:
-        # set new values
-        for i in df.columns:
-            model.set_value(i, df[i].tolist())
-        model.update()
+    # read values from csv to update model; coordinates are parsed straight to float64
+    table = pcsv.read_csv(data, convert_options=convert_options)
+    columns = table.column_names
 
-    # 2D
-    elif df.columns.tolist() == ["longitude", "latitude"]:
+    # 3D or 2D
+    if columns in (["longitude", "latitude", "elevation"], ["longitude", "latitude"]):
         # set new values
-        for i in df.columns:
-            model.set_value(i, df[i].tolist())
+        model.set_coordinates(np.column_stack([table.column(i).to_numpy() for i in columns]))
         model.update()
     else:
         raise ValueError(
@@ -47,9 +47,11 @@ for data, output in zip(list_data, list_output, strict=False):
         )
 
     # get values and save output to csv
-    dest_array = np.zeros(df.shape[0] * df.shape[1])
+    shape = (table.num_rows, table.num_columns)
+    dest_array = np.zeros(shape[0] * shape[1])
     model.get_value("coordinates__output", dest_array)
-    pd.DataFrame(columns=df.columns, data=dest_array.reshape(df.shape, order="F")).to_csv(output, index=False)
+    df_out = pd.DataFrame(columns=columns, data=dest_array.reshape(shape))
+    pcsv.write_csv(pa.Table.from_pandas(df_out, preserve_index=False), output)
 
     # demonstrating retrieving a 1D input var
     des_array = np.zeros(1)
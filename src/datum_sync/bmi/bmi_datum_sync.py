@@ -11,29 +11,38 @@ from datum_sync.bmi.config import DatumSyncConfig
 
 __all__ = ["BmiDatumSync"]
 
+COORDINATE_NAMES = ("longitude", "latitude", "elevation")
+# Number of points above which update() transforms on multiple threads. Measured transforms cost
+# ~55-110 ns per point while warming a pool thread costs one transformer build (10-210 ms), so only
+# batches of around a million points or more save more than the threads cost to start.
+PARALLEL_THRESHOLD = 1_000_000
+
 
 class BmiDatumSync(BmiBase):
     """BMI composition wrapper for datum sync"""
 
+    input_names = (
+        "longitude",
+        "latitude",
+        "elevation",
+        "crs_in",
+        "crs_out",
+        "z_warn",
+    )
+    output_names = ("coordinates__output",)
+
     def __init__(self) -> None:
         super()
 
-        self.input_names = (
-            "longitude",
-            "latitude",
-            "elevation",
-            "crs_in",
-            "crs_out",
-            "z_warn",
-        )
-        self.output_names = ("coordinates__output",)
-
-        self.input: dict[Any, Any] = dict(
-            zip(self.input_names, [0 for i in range(len(self.input_names))], strict=False)
-        )
-        self.output: dict[Any, Any] = dict(
-            zip(self.output_names, [0 for i in range(len(self.output_names))], strict=False)
-        )
+        self.input: dict[Any, Any] = dict.fromkeys(self.input_names, 0)
+        self.output: dict[Any, Any] = dict.fromkeys(self.output_names, 0)
+        self.syncer: DatumSync | None = None
+        # coordinate inputs set since initialization; update() dispatches on these
+        self._provided: set[str] = set()
+        # (3, N) longitude, latitude, elevation rows; coordinate inputs are views of its rows
+        self._coord_buf: NDArray | None = None
+        # (N, k) coordinate output reused across updates while N and k are unchanged
+        self._out_buf: NDArray | None = None
 
     def initialize(self, config_file: str | Path) -> None:
         """Intialize the BMI model with config, datum transformer, and datum sync class.
@@ -61,29 +70,39 @@ class BmiDatumSync(BmiBase):
 
     def update(self) -> None:
         """Update the model based on inputs"""
-        if self.input["longitude"] and self.input["latitude"] and self.input["elevation"]:
-            output = self.syncer.convert_datum(
-                np.array(self.input["longitude"]),
-                np.array(self.input["latitude"]),
-                self.input["elevation"],
-                z_warn=self.input["z_warn"],
-            )
-            self.output["coordinates__output"] = np.array([output[0], output[1], output[2]])
-        elif self.input["longitude"] and self.input["latitude"] and not self.input["elevation"]:
-            output = self.syncer.convert_datum(
-                np.array(self.input["longitude"]),
-                np.array(self.input["latitude"]),
-                z_warn=self.input["z_warn"],
-            )
-            self.output["coordinates__output"] = np.array([output[0], output[1]])
-        else:
+        if self.syncer is None:
+            raise RuntimeError("Model is not initialized. Use initialize before update")
+        if self._coord_buf is None or not {"longitude", "latitude"} <= self._provided:
             raise UserWarning(
                 "No longitude, latitude, elevation input. Use set_value to set longitude, latitude, and optionally elevation"
             )
+        # large batches are split across threads; small ones are not worth the dispatch
+        convert = (
+            self.syncer.convert_datum_parallel
+            if self._coord_buf.shape[1] > PARALLEL_THRESHOLD
+            else self.syncer.convert_datum
+        )
+        lon, lat, elev = self._coord_buf
+        output = convert(
+            lon, lat, elev if "elevation" in self._provided else None, z_warn=self.input["z_warn"]
+        )
+        self._store_output(output)
+
+    def _store_output(self, output: NDArray) -> None:
+        """Write (k, N) transformed axes into the persistent (N, k) output buffer"""
+        shape = output.shape[::-1]
+        if self._out_buf is None or self._out_buf.shape != shape:
+            self._out_buf = np.empty(shape, dtype=np.float64)
+        np.copyto(self._out_buf, output.T)
+        self.output["coordinates__output"] = self._out_buf
 
     def finalize(self) -> None:
         """Clean up any internal resources of the model"""
-        del self.syncer, self.input["longitude"], self.input["latitude"], self.input["elevation"]
+        # rebinding rather than deleting keys cannot fail on inputs that were never set
+        self.syncer = None
+        self.input = {}
+        self._provided = set()
+        self._coord_buf = None
 
     def get_component_name(self) -> str:
         """Name of this BMI module component.
@@ -144,6 +163,12 @@ class BmiDatumSync(BmiBase):
         """
         if name in self.output_names:
             self.output[name] = src
+        elif name in COORDINATE_NAMES:
+            values = np.asarray(src, dtype=np.float64).ravel()
+            row = self._coordinate_rows(values.size)[COORDINATE_NAMES.index(name)]
+            np.copyto(row, values)
+            self.input[name] = row
+            self._provided.add(name)
         elif name in self.input_names:
             self.input[name] = src
         else:
@@ -151,14 +176,51 @@ class BmiDatumSync(BmiBase):
                 f"Variable {name} does not exist input or output variables.  User getters to view options."
             )
 
+    def set_coordinates(self, coordinates: NDArray) -> None:
+        """Sets longitude, latitude and optionally elevation from a single array
+
+        Columns are copied into the rows of the coordinate buffer in one pass, so all axes are
+        converted together and handed to pyproj without further copies.
+
+        Args:
+            coordinates (NDArray): (N, 2) or (N, 3) array with columns longitude, latitude(, elevation)
+
+        Raises
+        ------
+            ValueError: If coordinates is not an (N, 2) or (N, 3) array
+        """
+        coords = np.asarray(coordinates, dtype=np.float64)
+        if coords.ndim != 2 or coords.shape[1] not in (2, 3):
+            raise ValueError(f"Coordinates must be an (N, 2) or (N, 3) array, not {coords.shape}")
+
+        n_points, n_axes = coords.shape
+        rows = self._coordinate_rows(n_points)
+        np.copyto(rows[:n_axes], coords.T)
+        for name, row in zip(COORDINATE_NAMES[:n_axes], rows, strict=False):
+            self.input[name] = row
+        self._provided = set(COORDINATE_NAMES[:n_axes])
+        if n_axes == 2:
+            self.input["elevation"] = 0
+
+    def _coordinate_rows(self, n_points: int) -> NDArray:
+        """The (3, N) coordinate buffer, reallocated when the number of points changes.
+
+        A new point count starts a new set of coordinates, so the other axes must be set again.
+        """
+        if self._coord_buf is None or self._coord_buf.shape[1] != n_points:
+            self._coord_buf = np.empty((len(COORDINATE_NAMES), n_points), dtype=np.float64)
+            self._provided = set()
+        return self._coord_buf
+
     def get_value(self, name: str, dest: NDArray) -> NDArray:
-        """_Copies_ a variable's np.np.ndarray into `dest` and returns `dest`."""
+        """_Copies_ a variable's np.np.ndarray into `dest` and returns `dest`.
+
+        Coordinate outputs are (N, k) row-major, so `dest` holds each point's x, y(, z) consecutively.
+        """
         value = self.get_value_ptr(name)
         try:
-            if not isinstance(value, np.ndarray):
-                dest[:] = np.array(value).flatten()
-            else:
-                dest[:] = self.get_value_ptr(name).flatten()
+            # ravel is a view of a contiguous array, leaving copyto as the only copy
+            np.copyto(dest, np.asarray(value).ravel(order="C"), casting="unsafe")
         except Exception as e:
             raise RuntimeError(f"Could not return value {name} as flattened array") from e
 
@@ -166,12 +228,12 @@ class BmiDatumSync(BmiBase):
 
     def get_value_ptr(self, name: str) -> NDArray:
         """Gets value in native form if exists in inputs or outputs"""
-        try:
+        if name in self.output:
             return self.output[name]
-        except KeyError:
+        elif name in self.input:
             return self.input[name]
-        except KeyError as e:  # NOQA: B025
-            raise KeyError(f"{name} is not a known variable") from e
+        else:
+            raise KeyError(f"{name} is not a known variable")
 
     def get_var_itemsize(self, name: str) -> int:
         """Size, in bytes, of a single element of the variable name
@@ -1,18 +1,238 @@
+import os
+import threading
 import warnings
+import weakref
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
 import pyproj
+from numpy.typing import NDArray
 from pyproj import CRS, Transformer
+from pyproj.exceptions import ProjError
 from pyproj.transformer import TransformerGroup
 
 from datum_sync.exceptions import TransformError, ZConversionWarning
 
 __all__ = ["DatumSync"]
 
+# This will allow transformation grids to be downloaded if they are not included in base package
+# Needed for vertical transform. It is a process-wide setting, so it is turned on once at import;
+# set DATUM_SYNC_NO_NETWORK=1 to leave it off (e.g. offline test runs); "", "0" and "false" keep it on.
+# TODO: Download grids a priori with package building; remove network connectivity
+if os.environ.get("DATUM_SYNC_NO_NETWORK", "").strip().lower() in ("", "0", "false"):
+    pyproj.network.set_network_enabled(active=True)
+
+# Batch runs repeat the same z warning for every file; show each message once per process.
+# Appended so any filter the user has already configured still takes precedence.
+warnings.filterwarnings("once", category=ZConversionWarning, append=True)
 
 FT_TO_M = 0.3048
 M_TO_FT = 3.28084
+# z values within this distance of a pure unit conversion are treated as unchanged (~2 decimals)
+Z_UNIT_TOLERANCE = 5e-3
+# leading values checked before scanning a full z array
+Z_SAMPLE_SIZE = 64
+
+
+@lru_cache(maxsize=256)
+def _crs(code: int) -> CRS:
+    """CRS for an EPSG code, cached to skip repeated PROJ database lookups"""
+    return CRS.from_epsg(code)
+
+
+# EPSG pairs already confirmed to have at least one usable transformation
+_VALIDATED: set[tuple[int, int, bool]] = set()
+
+
+def _validate_transformers(crs_input: int, crs_output: int, always_xy: bool = True) -> None:
+    """Raise if PROJ has no instantiable operation between two EPSG codes.
+
+    TransformerGroup builds every candidate operation, which is as costly as building the
+    transformer itself, so a pair is only checked until it passes once. Unlike the bounded
+    transformer cache, validated pairs are never evicted.
+    """
+    key = (crs_input, crs_output, always_xy)
+    if key in _VALIDATED:
+        return
+
+    group = TransformerGroup(crs_from=_crs(crs_input), crs_to=_crs(crs_output), always_xy=always_xy)
+    if len(group.transformers) == 0:
+        raise TransformError("No methods to transform between CRS found. Try another CRS.")
+    _VALIDATED.add(key)
+
+
+@lru_cache(maxsize=256)
+def _cached_transformer(crs_input: int, crs_output: int, always_xy: bool = True) -> Transformer:
+    """Build and validate a pyproj transformer once per EPSG pair.
+
+    Transformer construction is far more expensive than the transform itself, so the result is
+    cached, warmed with a throwaway transform and shared across DatumSync instances.
+    Failed builds raise and are not cached.
+
+    Args:
+        crs_input (int): The input EPSG CRS defined as int (e.g. 4326)
+        crs_output (int): The output EPSG CRS defined as int (e.g. 4326)
+        always_xy (bool): Use traditional GIS order (lon, lat). Defaults to True.
+
+    Returns
+    -------
+        Transformer: pyproj transformer
+    """
+    try:
+        crs_in = _crs(crs_input)
+        crs_out = _crs(crs_output)
+        transform = Transformer.from_crs(crs_from=crs_in, crs_to=crs_out, always_xy=always_xy)
+
+    except Exception as e:
+        raise TransformError("Issue creating CRS and transformer. Check if CRS are valid.") from e
+
+    # check that there's actual transformers
+    # TODO: re-find the test case that undercovered this issue
+    _validate_transformers(crs_input, crs_output, always_xy)
+
+    # PROJ sets up the operation pipeline on the first transform; do it here, once per pair,
+    # rather than on a caller's first conversion. Only the side effect is wanted.
+    with suppress(ProjError):
+        transform.transform(0.0, 0.0)
+
+    return transform
+
+
+def _all_close_scaled(zz: NDArray, out_z: NDArray, scale: float, atol: float) -> bool:
+    """Single streaming pass comparing out_z to zz * scale; stops at the first mismatch"""
+    for i in range(zz.size):
+        if not abs(out_z[i] - zz[i] * scale) <= atol:  # NaN counts as a mismatch, as in np.allclose
+            return False
+    return True
+
+
+def _count_not_scaled(zz: NDArray, out_z: NDArray, scale: float, atol: float) -> int:
+    """Number of values where out_z differs from zz * scale by more than atol"""
+    count = 0
+    for i in _prange(zz.size):
+        if not abs(out_z[i] - zz[i] * scale) <= atol:
+            count += 1
+    return count
+
+
+# Compiled on first use and cached to disk. The serial kernel exits early on the leading sample;
+# the full pass is a prange sum reduction, which cannot exit early but uses every core.
+# No fastmath: it would let NaN compare as close.
+_all_close_scaled_jit: Callable[[NDArray, NDArray, float, float], bool] | None
+_count_not_scaled_jit: Callable[[NDArray, NDArray, float, float], int] | None
+try:
+    from numba import njit
+    from numba import prange as _prange
+except ImportError:  # numba is optional; z checks fall back to NumPy
+    from builtins import range as _prange
+
+    _all_close_scaled_jit = None
+    _count_not_scaled_jit = None
+else:
+    _all_close_scaled_jit = njit(cache=True)(_all_close_scaled)
+    _count_not_scaled_jit = njit(cache=True, parallel=True)(_count_not_scaled)
+
+
+def _is_scaled(zz: NDArray, out_z: NDArray, scale: float) -> bool:
+    """Whether out_z equals zz * scale within Z_UNIT_TOLERANCE.
+
+    A small leading sample is compared first so the common "values changed" case exits without
+    a full pass over large arrays. The numba kernels are used when installed, NumPy otherwise.
+    """
+    if zz.shape != out_z.shape:
+        return False
+
+    sample = slice(0, Z_SAMPLE_SIZE)
+    if _all_close_scaled_jit is not None and _count_not_scaled_jit is not None:
+        if not _all_close_scaled_jit(zz[sample], out_z[sample], scale, Z_UNIT_TOLERANCE):
+            return False
+        return zz.size <= Z_SAMPLE_SIZE or _count_not_scaled_jit(zz, out_z, scale, Z_UNIT_TOLERANCE) == 0
+
+    if not np.allclose(out_z[sample], zz[sample] * scale, rtol=0, atol=Z_UNIT_TOLERANCE):
+        return False
+    return bool(np.allclose(out_z, zz * scale, rtol=0, atol=Z_UNIT_TOLERANCE))
+
+
+def _as_f64_view(a: Any) -> NDArray:
+    """Return `a` itself if it is already a C-contiguous float64 array, else a converted copy.
+
+    Scalars become 0-d arrays, so they broadcast like scalars.
+    """
+    if isinstance(a, np.ndarray) and a.dtype == np.float64 and a.flags.c_contiguous:
+        return a
+    return np.asarray(a, dtype=np.float64, order="C")
+
+
+def _coordinate_buffer(xx: Any, yy: Any, zz: Any) -> tuple[NDArray, NDArray | None, tuple[int, ...]]:
+    """Copy coordinates into one (2, N) or (3, N) float64 buffer, broadcasting them against each other.
+
+    Returns
+    -------
+        tuple: The buffer, the float64 input z in the broadcast shape (or None) and the broadcast shape
+    """
+    axes = [_as_f64_view(xx), _as_f64_view(yy)]
+    if zz is not None:
+        axes.append(_as_f64_view(zz))
+    shape = np.broadcast_shapes(*(axis.shape for axis in axes))
+    coords = np.empty((len(axes), int(np.prod(shape))), dtype=np.float64)
+    for row, axis in zip(coords, axes, strict=True):
+        # the row is contiguous, so this reshape is a view and numpy broadcasts straight into it
+        np.copyto(row.reshape(shape), axis)
+    z = None
+    if zz is not None:
+        z = axes[2] if axes[2].shape == shape else np.broadcast_to(axes[2], shape)
+    return coords, z, shape
+
+
+# Fewest points handed to one pool thread. Transforms cost ~55-110 ns per point, so a slice is a few
+# milliseconds of work, far above the cost of dispatching it; smaller batches run on the calling thread.
+PARALLEL_MIN_SLICE = 50_000
+
+_POOL_SIZE = os.cpu_count() or 1
+_EXECUTOR: ThreadPoolExecutor | None = None
+
+# pyproj keeps one PROJ object per thread, so each pool thread rebuilds a transformer on first use
+# (10-200+ ms). ids of the transformers already warmed on every pool thread.
+_POOL_WARMED: set[int] = set()
+_POOL_WARM_LOCK = threading.Lock()
+
+
+def _executor() -> ThreadPoolExecutor:
+    """Thread pool shared by all parallel conversions, created on first use"""
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ThreadPoolExecutor(max_workers=_POOL_SIZE, thread_name_prefix="datum_sync")
+    return _EXECUTOR
+
+
+def _warm_pool(transform: Transformer) -> None:
+    """Build and warm `transform` on every pool thread, once per transformer.
+
+    Every thread is warmed, not just as many as a batch has slices, because the executor starts
+    new threads whenever none is idle at submit time. Each warm-up task waits at a barrier until
+    all have started, so no thread takes two of them. Warm-ups are serialized so two of them
+    cannot split the pool and wait on each other.
+    """
+    with _POOL_WARM_LOCK:
+        key = id(transform)
+        if key in _POOL_WARMED:
+            return
+        barrier = threading.Barrier(_POOL_SIZE)
+
+        def warm() -> None:
+            barrier.wait()
+            with suppress(ProjError):
+                transform.transform(0.0, 0.0)
+
+        for future in [_executor().submit(warm) for _ in range(_POOL_SIZE)]:
+            future.result()
+        # ids are reused once an object is collected, so forget it with the transformer
+        weakref.finalize(transform, _POOL_WARMED.discard, key)
+        _POOL_WARMED.add(key)
 
 
 class DatumSync:
@@ -29,7 +249,6 @@ class DatumSync:
     ) -> None:
         """Instantiates a DatumSync class.
 
-        Turns on network enabled setting to download external grid.
         Must instantiate with either crs_input and crs_output _OR_ transform; but not both.
         Error raised if incorrectly instantiated.
 
@@ -42,11 +261,6 @@ class DatumSync:
                     Specified instead of using crs_input and crs_output
 
         """
-        # This will allow transformation grids to be downloaded if they are not included in base package
-        # Needed for vertical transform
-        # TODO: Download grids a priori with package building; remove network connectivity
-        pyproj.network.set_network_enabled(active=True)
-
         # determine if correct units passed in
         if (
             (transform and crs_input)
@@ -64,15 +278,22 @@ class DatumSync:
             if transform
             else DatumSync.epsg_to_transform(crs_input=crs_input, crs_output=crs_output)  # type: ignore[arg-type]
         )
+        # input z and transformed coordinates, only held while the z checks run
+        self.zz: Any = None
+        self.output: Any = None
 
-    def convert_datum(self, xx: Any, yy: Any, zz: Any = None, z_warn: bool = True) -> tuple:
+    def convert_datum(
+        self, xx: Any, yy: Any, zz: Any = None, z_warn: bool = True, radians: bool = False
+    ) -> NDArray:
         """Convert coordinates between input and output EPSG CRS.
 
         Wraps pyproj transformer. It is designed to be attentive to Z conversions and will warn when
         Z conversions do not happen or if the only difference is between meters <-> feet. Inputs values
         can be of any pyproj transformer accepted class. CRS must be input as EPSG integers.
 
-
+        Coordinates are copied once into a single float64 buffer which pyproj transforms in place.
+        The inputs are broadcast against each other, so e.g. a scalar elevation applies to every point
+        or a column of latitudes and a row of longitudes describe a grid.
 
         Either define crs_input and crs_output OR define transform. Will raise error if incorrectly specified.
 
@@ -81,11 +302,12 @@ class DatumSync:
             yy (Any): Scalar or array. Input y coordinate(s).
             zz (Any): Scalar or array. Input z coordinate(s).
             z_warn (bool): Flag to check to see if z values were convereted and warn if not. Defaults to True.
-
+            radians (bool): Geographic coordinates are in radians rather than degrees, in and out. Defaults to False.
 
         Returns
         -------
-            tuple: Transformed coordinates in tuple matching input type
+            NDArray: Transformed coordinates as a float64 array of shape (2, ...) or (3, ...),
+                one row per axis (x, y, z) in the broadcast shape of the inputs.
 
         From pyproj:
         Accepted numeric scalar or array:
@@ -101,34 +323,88 @@ class DatumSync:
             - :class:`xarray.DataArray`
             - :class:`pandas.Series`
         """
-        # for transforming 3D coordinates
-        if zz is not None:
-            # saving to class for checks
-            output = self.transform.transform(xx, yy, zz)
+        coords, z, shape = _coordinate_buffer(xx, yy, zz)
+        self._transform_inplace(coords, radians)
+        return self._finish(coords, z, shape, z_warn)
+
+    def convert_datum_parallel(
+        self,
+        xx: Any,
+        yy: Any,
+        zz: Any = None,
+        z_warn: bool = True,
+        workers: int | None = None,
+        radians: bool = False,
+    ) -> NDArray:
+        """Convert coordinates like convert_datum, splitting large batches across threads.
+
+        pyproj releases the GIL while transforming, so disjoint slices of the coordinate buffer
+        are transformed concurrently on a shared thread pool. Each slice holds at least
+        PARALLEL_MIN_SLICE points; smaller batches are transformed on the calling thread. The first
+        parallel use of a transformer warms it on every pool thread, which costs one transformer
+        build per thread, so this pays off for very large or repeated batches.
+
+        Args:
+            xx (Any): Scalar or array. Input x coordinate(s).
+            yy (Any): Scalar or array. Input y coordinate(s).
+            zz (Any): Scalar or array. Input z coordinate(s).
+            z_warn (bool): Flag to check to see if z values were convereted and warn if not. Defaults to True.
+            workers (int): Most slices to split the coordinates into. Defaults to the CPU count.
+            radians (bool): Geographic coordinates are in radians rather than degrees, in and out. Defaults to False.
 
-            if z_warn:
-                self.output = output
-                self.zz = zz
-                # check if Z was converted; warn if not
-                self._check_z_conversion()
+        Returns
+        -------
+            NDArray: Transformed coordinates, as returned by convert_datum
+        """
+        coords, z, shape = _coordinate_buffer(xx, yy, zz)
+        n_slices = min(workers or _POOL_SIZE, coords.shape[1] // PARALLEL_MIN_SLICE)
+        if n_slices <= 1:
+            self._transform_inplace(coords, radians)
+            return self._finish(coords, z, shape, z_warn)
+
+        _warm_pool(self.transform)
+        edges = np.linspace(0, coords.shape[1], n_slices + 1, dtype=int)
+        futures = [
+            _executor().submit(self._transform_inplace, coords[:, start:stop], radians)
+            for start, stop in zip(edges[:-1], edges[1:], strict=True)
+        ]
+        for future in futures:
+            future.result()
+        return self._finish(coords, z, shape, z_warn)
+
+    def _transform_inplace(self, coords: NDArray, radians: bool = False) -> None:
+        """Transform a (2, N) or (3, N) float64 buffer in place"""
+        # each row is contiguous, so pyproj writes the results straight back into the buffer
+        if len(coords) == 2:
+            self.transform.transform(coords[0], coords[1], radians=radians, inplace=True)
+        else:
+            self.transform.transform(coords[0], coords[1], coords[2], radians=radians, inplace=True)
 
-                # check if z was only changed between M and FT; warn if so
-                self._check_z_units()
+    def _finish(self, coords: NDArray, z: NDArray | None, shape: tuple[int, ...], z_warn: bool) -> NDArray:
+        """Run the z checks on transformed coordinates and restore the input shape"""
+        # for transforming 3D coordinates
+        if z is not None and z_warn:
+            # saving to class for checks; the input z array is untouched by the in-place transform
+            self.output = coords
+            self.zz = z
+            # check if Z was converted; warn if not
+            self._check_z_conversion()
 
-                # remove from instance
-                self.zz = None
-                self.output = None
+            # check if z was only changed between M and FT; warn if so
+            self._check_z_units()
 
-            return output
+            # release from instance
+            self.zz = None
+            self.output = None
 
-        # 2D transformation
-        else:
-            return self.transform.transform(xx, yy)
+        return coords.reshape((len(coords), *shape))
 
     @staticmethod
     def epsg_to_transform(crs_input: int, crs_output: int) -> Transformer:
         """Convert an EPSG CRS defined as an int to a pyproj transformer.
 
+        Transformers are cached per (crs_input, crs_output) pair, so repeated calls return the same object.
+
         Args:
             crs_input (int): The input EPSG CRS defined as int (e.g. 4326)
             crs_output (int): The output EPSG CRS defined as int (e.g. 4326)
@@ -137,30 +413,19 @@ class DatumSync:
         -------
             Transformer: pyproj transformer
         """
-        # This will allow transformation grids to be downloaded if they are not included in base package
-        # Needed for vertical transform
-        # TODO: Download grids a priori with package building; remove network connectivity
-        pyproj.network.set_network_enabled(active=True)
-
-        try:
-            crs_in = CRS.from_epsg(crs_input)
-            crs_out = CRS.from_epsg(crs_output)
-            transform = Transformer.from_crs(crs_from=crs_in, crs_to=crs_out, always_xy=True)
+        return _cached_transformer(crs_input, crs_output)
 
-        except Exception as e:
-            raise TransformError("Issue creating CRS and transformer. Check if CRS are valid.") from e
-
-        # check that there's actual transformers
-        # TODO: re-find the test case that undercovered this issue
-        transformer_group = TransformerGroup(crs_from=crs_in, crs_to=crs_out, always_xy=True)
-        if len(transformer_group.transformers) == 0:
-            raise TransformError("No methods to transform between CRS found. Try another CRS.")
-
-        return transform
+    def _z_arrays(self) -> tuple[NDArray, NDArray]:
+        """Input and output z values as flat float64 arrays; no copy if already contiguous float64"""
+        return (
+            _as_f64_view(self.zz).ravel(),
+            _as_f64_view(self.output[2]).ravel(),
+        )
 
     def _check_z_conversion(self) -> None:
         """Checks that an output was converted. This may or may not be intentional"""
-        if (np.array(self.output[2], dtype=float) == np.array(self.zz, dtype=float)).all():
+        zz, out_z = self._z_arrays()
+        if np.array_equal(out_z, zz):
             warnings.warn(
                 "Z values were not altered. This could be expected. This may be because input and output CRS do not have vertical element.",
                 ZConversionWarning,
@@ -169,9 +434,8 @@ class DatumSync:
 
     def _check_z_units(self) -> None:
         """Check to see if z units were changed, but no value change happened"""
-        if (np.round(np.array(self.output[2]), 2) == np.round(np.array(self.zz) * FT_TO_M, 2)).all() or (
-            np.round(np.array(self.output[2]), 2) == np.round(np.array(self.zz) * M_TO_FT, 2)
-        ).all():
+        zz, out_z = self._z_arrays()
+        if _is_scaled(zz, out_z, FT_TO_M) or _is_scaled(zz, out_z, M_TO_FT):
             warnings.warn(
                 "Z values were converted between meters and feet but were not altered."
                 " This may be because input and output CRS do not have vertical element.",
@@ -0,0 +1,13 @@
+import pytest
+
+from datum_sync import DatumSync
+
+# EPSG pairs used across the unit tests and their BMI configs
+TEST_CRS_PAIRS = [(4269, 4326), (4979, 5498), (5498, 5070), (4326, 4269), (5070, 5498)]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_transformers() -> None:
+    """Build, validate and warm each test transformer once so PROJ setup stays out of the test bodies"""
+    for crs_input, crs_output in TEST_CRS_PAIRS:
+        DatumSync.epsg_to_transform(crs_input, crs_output)
@@ -10,11 +10,8 @@ from datum_sync.bmi.bmi_datum_sync import BmiDatumSync
 
 # Column matching helper
 def find_column(columns, keys):
-    for key in keys:
-        for col in columns:
-            if key in col.lower():
-                return col
-    return None
+    lowered = [(col, col.lower()) for col in columns]
+    return next((col for key in keys for col, col_lower in lowered if key in col_lower), None)
 
 # Parametrize test using actual CSV files
 project_root = Path(__file__).resolve().parents[2]
@@ -4,8 +4,10 @@ from typing import Any
 import numpy as np
 import pytest
 from numpy.testing import assert_array_almost_equal, assert_array_equal
+from pyproj import Transformer
 
 from datum_sync.bmi import BmiDatumSync
+from datum_sync.bmi.bmi_datum_sync import PARALLEL_THRESHOLD
 from datum_sync.bmi.config import DatumSyncConfig
 
 dir = Path(__file__).parent
@@ -58,38 +60,86 @@ def test_initialize(base_model_xy: BmiDatumSync) -> None:
     assert not model.input["z_warn"]
 
 
+def test_initialize__shared_transformer(base_model_xy: BmiDatumSync) -> None:
+    """Re-initializing with the same config reuses the cached transformer"""
+    model = BmiDatumSync()
+    model.initialize(dir / "config/config_base_xy.yaml")
+    assert model.syncer is not None and base_model_xy.syncer is not None
+    assert model.syncer.transform is base_model_xy.syncer.transform
+
+
 def test_update_coordinates__xy(base_model_xy: BmiDatumSync) -> None:
     model = base_model_xy
-    model.set_value("longitude", [-80, -81])
-    model.set_value("latitude", [40, 41])
+    model.set_value("longitude", np.array([-80.0, -81.0]))
+    model.set_value("latitude", np.array([40.0, 41.0]))
     model.update()
     assert_array_almost_equal(
-        model.output["coordinates__output"], np.array([[-79.999998, -80.999999], [39.999998, 40.999999]])
+        model.output["coordinates__output"], np.array([[-79.999998, 39.999998], [-80.999999, 40.999999]])
     )
 
 
 def test_update_coordinates__xyz(base_model_xyz: BmiDatumSync) -> None:
     """Use the XYZ base model to check elevation conversions"""
     model = base_model_xyz
-    model.set_value("longitude", [-79.4, -79])
-    model.set_value("latitude", [43.7, 43])
-    model.set_value("elevation", [100, 110])
+    model.set_value("longitude", np.array([-79.4, -79.0]))
+    model.set_value("latitude", np.array([43.7, 43.0]))
+    model.set_value("elevation", np.array([100.0, 110.0]))
     model.update()
     assert_array_almost_equal(
         model.output["coordinates__output"],
-        np.array([[-79.3999985, -78.9999969], [43.6999915, 42.9999918], [137.6331231, 146.6187439]]),
+        np.array([[-79.3999985, 43.6999915, 137.6331231], [-78.9999969, 42.9999918, 146.6187439]]),
     )
 
 
+def test_update__no_coordinates(base_model_xy: BmiDatumSync) -> None:
+    """Update without longitude and latitude set raises instead of testing placeholder values"""
+    model = base_model_xy
+    model.set_value("longitude", np.array([-80.0, -81.0]))
+    with pytest.raises(UserWarning, match="No longitude, latitude, elevation input."):
+        model.update()
+
+
+def test_update__reuses_output_buffer(base_model_xy: BmiDatumSync) -> None:
+    """Updates with the same number of points write into the same output array"""
+    model = base_model_xy
+    model.set_value("longitude", np.array([-80.0, -81.0]))
+    model.set_value("latitude", np.array([40.0, 41.0]))
+    model.update()
+    first = model.get_value_ptr("coordinates__output")
+    model.set_value("longitude", np.array([-82.0, -83.0]))
+    model.update()
+    assert model.get_value_ptr("coordinates__output") is first
+    assert first.shape == (2, 2)
+
+
+@pytest.mark.parametrize("n_points", [1, 2, 1000, PARALLEL_THRESHOLD])
+def test_update_bulk_no_python_transform(
+    monkeypatch: pytest.MonkeyPatch, base_model_xy: BmiDatumSync, n_points: int
+) -> None:
+    """Each update is one pyproj call over all points, never a per-point loop"""
+    calls = []
+    transform = Transformer.transform
+
+    def counting_transform(self: Transformer, *args: Any, **kwargs: Any) -> Any:
+        calls.append(len(args[0]))
+        return transform(self, *args, **kwargs)
+
+    monkeypatch.setattr(Transformer, "transform", counting_transform)
+    model = base_model_xy
+    model.set_value("longitude", np.linspace(-81.0, -80.0, n_points))
+    model.set_value("latitude", np.linspace(40.0, 41.0, n_points))
+    model.update()
+    assert calls == [n_points]
+
+
 def test_finalize(base_model_xy: BmiDatumSync) -> None:
-    """Confirm finalize deleted attributes"""
+    """Confirm finalize released the syncer and inputs"""
     model = base_model_xy
     model.finalize()
     for param in ["longitude", "latitude", "elevation"]:
         with pytest.raises(KeyError):
             model.input[param]
-    with pytest.raises(AttributeError):
-        _ = model.syncer
+    assert model.syncer is None
 
 
 def test_get_component_name(base_model_xy: BmiDatumSync) -> None:
@@ -103,6 +153,45 @@ def test_set_value(base_model_xy: BmiDatumSync) -> None:
     assert model.input["longitude"] == [1]
 
 
+def test_set_value__coordinate_buffer(base_model_xy: BmiDatumSync) -> None:
+    """Coordinate inputs are rows of one float64 buffer; a new point count starts over"""
+    model = base_model_xy
+    model.set_value("longitude", [-80, -81])
+    model.set_value("latitude", [40, 41])
+    assert model.input["longitude"].base is model.input["latitude"].base
+    assert model.input["latitude"].dtype == np.float64
+    assert model._provided == {"longitude", "latitude"}
+
+    model.set_value("longitude", [-80.0, -81.0, -82.0])
+    assert model._provided == {"longitude"}
+    assert model.input["longitude"].base.shape == (3, 3)
+
+
+@pytest.mark.parametrize(
+    "longitude,latitude",
+    [
+        pytest.param([-80, -81], [40, 41], id="int list"),
+        pytest.param(np.array([-80, -81]), np.array([40, 41]), id="int array"),
+        pytest.param([-80.0, -81.0], [40.0, 41.0], id="float list"),
+        pytest.param(np.array([-80.0, -81.0]), np.array([40.0, 41.0]), id="float array"),
+    ],
+)
+def test_set_value__coordinates_float64(base_model_xy: BmiDatumSync, longitude: Any, latitude: Any) -> None:
+    """Coordinates are float64 whatever the caller passes, so every input gives the same output"""
+    model = base_model_xy
+    model.set_value("longitude", np.array([-80.0, -81.0]))
+    model.set_value("latitude", np.array([40.0, 41.0]))
+    model.update()
+    expected = model.get_value_ptr("coordinates__output").copy()
+
+    model.set_value("longitude", longitude)
+    model.set_value("latitude", latitude)
+    assert model.input["longitude"].dtype == np.float64
+    assert model.input["latitude"].dtype == np.float64
+    model.update()
+    assert_array_equal(model.get_value_ptr("coordinates__output"), expected)
+
+
 def test_set_value__error(base_model_xy: BmiDatumSync) -> None:
     model = base_model_xy
     with pytest.raises(
@@ -112,6 +201,25 @@ def test_set_value__error(base_model_xy: BmiDatumSync) -> None:
         model.set_value("fake", [1])
 
 
+def test_set_coordinates(base_model_xy: BmiDatumSync) -> None:
+    model = base_model_xy
+    model.set_coordinates(np.array([[-80, 40, 100], [-81, 41, 110]]))
+    assert_array_equal(model.input["longitude"], np.array([-80.0, -81.0]))
+    assert_array_equal(model.input["latitude"], np.array([40.0, 41.0]))
+    assert_array_equal(model.input["elevation"], np.array([100.0, 110.0]))
+    assert model.input["longitude"].flags.c_contiguous
+
+    # 2D coordinates clear a previously set elevation
+    model.set_coordinates(np.array([[-80, 40], [-81, 41]]))
+    assert model.input["elevation"] == 0
+
+
+def test_set_coordinates__error(base_model_xy: BmiDatumSync) -> None:
+    model = base_model_xy
+    with pytest.raises(ValueError, match="Coordinates must be an"):
+        model.set_coordinates(np.array([-80, -81]))
+
+
 def test_get_value(base_model_xy: BmiDatumSync) -> None:
     model = base_model_xy
     model.set_value("longitude", [1])
@@ -120,6 +228,15 @@ def test_get_value(base_model_xy: BmiDatumSync) -> None:
     assert_array_equal(dest_array, np.array([1.0]))
 
 
+def test_get_value__coordinates_output(base_model_xy: BmiDatumSync) -> None:
+    """Coordinate output is (N, k) so each point's values are adjacent once flattened"""
+    model = base_model_xy
+    model.set_value("coordinates__output", np.array([[-80.0, 40.0], [-81.0, 41.0]]))
+    dest_array = np.zeros(4)
+    model.get_value("coordinates__output", dest_array)
+    assert_array_equal(dest_array, np.array([-80.0, 40.0, -81.0, 41.0]))
+
+
 get_value_ptr_data = [
     pytest.param("longitude", [1], id="get value ptr input var"),
     pytest.param(
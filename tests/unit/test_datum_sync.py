@@ -2,10 +2,12 @@ from typing import Any
 
 import numpy as np
 import pytest
-from numpy.testing import assert_array_almost_equal
+from numpy.testing import assert_array_almost_equal, assert_array_equal
 from numpy.typing import NDArray
 from pyproj import CRS, Transformer
+from pyproj.transformer import TransformerGroup
 
+import datum_sync.datum_sync as datum_sync_module
 from datum_sync import DatumSync
 from datum_sync.exceptions import TransformError, ZConversionWarning
 
@@ -53,14 +55,150 @@ convert_datum_data = [
 ]
 
 
+@pytest.fixture(scope="session")
+def _syncer_cache() -> dict[tuple[int, int], DatumSync]:
+    """DatumSync instances shared by every test in the session, keyed on (crs_input, crs_output)"""
+    return {}
+
+
 @pytest.mark.parametrize("xx,yy,zz,crs,expected", convert_datum_data)
-def test_convert_datum(xx: Any, yy: Any, zz: Any, crs: tuple[int, int], expected: NDArray) -> None:
+def test_convert_datum(
+    _syncer_cache: dict[tuple[int, int], DatumSync],
+    xx: Any,
+    yy: Any,
+    zz: Any,
+    crs: tuple[int, int],
+    expected: NDArray,
+) -> None:
     """Convert datum between XY or XYZ. Use approx equals to handle floating point difference by OS"""
-    syncer = DatumSync(crs_input=crs[0], crs_output=crs[1])
+    if crs not in _syncer_cache:
+        _syncer_cache[crs] = DatumSync(crs_input=crs[0], crs_output=crs[1])
+    syncer = _syncer_cache[crs]
     output = syncer.convert_datum(xx=xx, yy=yy, zz=zz)
 
     # assert at 6 decimals
-    assert_array_almost_equal(np.array(output), expected)
+    assert_array_almost_equal(output, expected)
+
+
+def test_convert_datum__inputs_unchanged() -> None:
+    """Transforming in place writes to an internal buffer, never to the caller's arrays"""
+    xx = np.array([-79.39999849691358, -78.99999685400357])
+    yy = np.array([43.69999146739919, 42.99999183172088])
+    zz = np.array([137.6331231, 146.6187439])
+    syncer = DatumSync(crs_input=5498, crs_output=5070)
+    output = syncer.convert_datum(xx=xx, yy=yy, zz=zz, z_warn=False)
+
+    assert output.shape == (3, 2)
+    assert output.dtype == np.float64
+    assert output.flags.c_contiguous
+    assert_array_equal(xx, np.array([-79.39999849691358, -78.99999685400357]))
+    assert_array_equal(yy, np.array([43.69999146739919, 42.99999183172088]))
+    assert not np.shares_memory(output, xx)
+
+
+def test_convert_datum__scalar() -> None:
+    """Scalar inputs give one value per axis"""
+    syncer = DatumSync(crs_input=5498, crs_output=5070)
+    output = syncer.convert_datum(xx=-79.39999849691358, yy=43.69999146739919)
+    assert_array_almost_equal(output, np.array([1325676.0689027791, 2416931.24897092]))
+
+
+def test_convert_datum__broadcast() -> None:
+    """Scalar elevation and a lon row / lat column broadcast like the equivalent full arrays"""
+    syncer = DatumSync(crs_input=5498, crs_output=5070)
+    lon = np.array([-79.4, -79.0, -78.6])
+    lat = np.array([[43.7], [43.0]])
+    full_lon, full_lat = np.meshgrid(lon, lat[:, 0])
+    expected = syncer.convert_datum(xx=full_lon, yy=full_lat, zz=np.full((2, 3), 100.0), z_warn=False)
+    output = syncer.convert_datum(xx=lon, yy=lat, zz=100.0, z_warn=False)
+    assert output.shape == (3, 2, 3)
+    assert_array_equal(output, expected)
+
+
+@pytest.mark.parametrize("parallel", [False, True], ids=["serial", "parallel"])
+def test_convert_datum__radians(parallel: bool) -> None:
+    """Radian input gives the same projected output as degrees"""
+    xx = np.array([-79.39999849691358, -78.99999685400357])
+    yy = np.array([43.69999146739919, 42.99999183172088])
+    syncer = DatumSync(crs_input=5498, crs_output=5070)
+    convert = syncer.convert_datum_parallel if parallel else syncer.convert_datum
+    expected = syncer.convert_datum(xx=xx, yy=yy)
+    output = convert(xx=np.deg2rad(xx), yy=np.deg2rad(yy), radians=True)
+    assert_array_almost_equal(output, expected)
+
+
+@pytest.mark.parametrize("workers", [1, 4, 2000])
+def test_convert_datum_parallel(monkeypatch: pytest.MonkeyPatch, workers: int) -> None:
+    """Threaded conversion matches the single call, including more workers than points"""
+    monkeypatch.setattr(datum_sync_module, "PARALLEL_MIN_SLICE", 1)
+    rng = np.random.default_rng(0)
+    xx = rng.uniform(-80, -78, 1000)
+    yy = rng.uniform(42, 44, 1000)
+    zz = rng.uniform(0, 200, 1000)
+    syncer = DatumSync(crs_input=5498, crs_output=5070)
+    expected = syncer.convert_datum(xx=xx, yy=yy, zz=zz, z_warn=False)
+    output = syncer.convert_datum_parallel(xx=xx, yy=yy, zz=zz, z_warn=False, workers=workers)
+    assert_array_equal(output, expected)
+
+
+def test_convert_datum_parallel__small_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Batches below the minimum slice size stay on the calling thread"""
+
+    def no_pool() -> None:
+        raise AssertionError("thread pool used")
+
+    monkeypatch.setattr(datum_sync_module, "_executor", no_pool)
+    syncer = DatumSync(crs_input=5498, crs_output=5070)
+    xx = np.linspace(-80, -78, 1000)
+    yy = np.linspace(42, 44, 1000)
+    assert_array_equal(syncer.convert_datum_parallel(xx=xx, yy=yy), syncer.convert_datum(xx=xx, yy=yy))
+
+
+def test_convert_datum_parallel__warms_pool_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Each pool thread builds the transformer once, not on every call"""
+    monkeypatch.setattr(datum_sync_module, "PARALLEL_MIN_SLICE", 1)
+    monkeypatch.setattr(datum_sync_module, "_POOL_SIZE", 3)
+    monkeypatch.setattr(datum_sync_module, "_EXECUTOR", None)
+    transform = Transformer.from_crs(5498, 5070, always_xy=True)
+    builds = []
+    maker = transform._transformer_maker
+
+    def counting_maker() -> Any:
+        builds.append(1)
+        return maker()
+
+    monkeypatch.setattr(transform, "_transformer_maker", counting_maker)
+    syncer = DatumSync(transform=transform)
+    try:
+        for workers in [2, 3, 3]:
+            syncer.convert_datum_parallel(
+                xx=np.linspace(-80, -78, 100), yy=np.linspace(42, 44, 100), workers=workers
+            )
+    finally:
+        datum_sync_module._executor().shutdown()
+    assert len(builds) == 3
+
+
+def test_as_f64_view__no_copy() -> None:
+    """Contiguous float64 arrays are passed through without a copy"""
+    arr = np.array([1.0, 2.0])
+    assert datum_sync_module._as_f64_view(arr) is arr
+
+
+as_f64_view_data = [
+    pytest.param([1, 2], id="list"),
+    pytest.param(np.array([1, 2]), id="int array"),
+    pytest.param(np.array([1.0, 0.0, 2.0])[::2], id="strided float array"),
+]
+
+
+@pytest.mark.parametrize("value", as_f64_view_data)
+def test_as_f64_view__convert(value: Any) -> None:
+    """Other inputs are converted to contiguous float64"""
+    output = datum_sync_module._as_f64_view(value)
+    assert output.dtype == np.float64
+    assert output.flags.c_contiguous
+    assert_array_equal(output, np.array([1.0, 2.0]))
 
 
 def test_convert_datum__z_warning() -> None:
@@ -84,16 +222,43 @@ def test_convert_datum__z_warning() -> None:
         match="Z values were not altered. This could be expected. This may be because input and output CRS do not have vertical element.",
     ):
         output = syncer.convert_datum(xx=xx, yy=yy, zz=zz)
-        assert_array_almost_equal(np.array(output), expected)
+        assert_array_almost_equal(output, expected)
 
 
 def test_epsg_to_transform() -> None:
     """epsg_to_transform should be same as from CRS"""
     transform = DatumSync.epsg_to_transform(4326, 4269)
-    expected = Transformer.from_crs(4326, 4269, always_xy=True)
+    expected = Transformer.from_crs(
+        datum_sync_module._crs(4326), datum_sync_module._crs(4269), always_xy=True
+    )
     assert transform == expected
 
 
+def test_crs__cached() -> None:
+    """EPSG codes are parsed into a CRS once"""
+    assert datum_sync_module._crs(4326) is datum_sync_module._crs(4326)
+
+
+def test_epsg_to_transform__cached() -> None:
+    """Repeated EPSG pairs reuse the same transformer"""
+    assert DatumSync.epsg_to_transform(4326, 4269) is DatumSync.epsg_to_transform(4326, 4269)
+
+
+def test_validate_transformers__once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """TransformerGroup is only built until a pair validates"""
+    calls = []
+
+    def counting_group(*args: Any, **kwargs: Any) -> TransformerGroup:
+        calls.append(args)
+        return TransformerGroup(*args, **kwargs)
+
+    monkeypatch.setattr(datum_sync_module, "TransformerGroup", counting_group)
+    monkeypatch.setattr(datum_sync_module, "_VALIDATED", set())
+    datum_sync_module._validate_transformers(4326, 3857)
+    datum_sync_module._validate_transformers(4326, 3857)
+    assert len(calls) == 1
+
+
 def test_epsg_to_transform__exception() -> None:
     """Transform error if bad transformation happens, e.g. bad CRS values"""
     with pytest.raises(TransformError, match="Issue creating CRS and transformer. Check if CRS are valid."):
@@ -127,6 +292,33 @@ def test_check_z_units() -> None:
         syncer._check_z_units()
 
 
+is_scaled_data = [
+    pytest.param(np.array([1.0, 10.0]), np.array([0.3048, 3.048]), True, id="feet to meters"),
+    pytest.param(np.array([1.0, 10.0]), np.array([0.3048, 3.5]), False, id="values changed"),
+    pytest.param(np.array([1.0]), np.array([0.3048, 3.048]), False, id="shape mismatch"),
+    pytest.param(np.array([1.0, np.nan]), np.array([0.3048, np.nan]), False, id="nan"),
+    pytest.param(np.arange(1000.0), np.arange(1000.0) * 0.3048, True, id="large feet to meters"),
+    pytest.param(
+        np.arange(1000.0),
+        np.append(np.arange(999.0) * 0.3048, 0.0),
+        False,
+        id="large values changed past sample",
+    ),
+]
+
+
+@pytest.mark.parametrize("jit", [True, False], ids=["numba or fallback", "numpy"])
+@pytest.mark.parametrize("zz,out_z,expected", is_scaled_data)
+def test_is_scaled(
+    monkeypatch: pytest.MonkeyPatch, jit: bool, zz: NDArray, out_z: NDArray, expected: bool
+) -> None:
+    """Unit-only z check gives the same answer with and without the numba kernel"""
+    if not jit:
+        monkeypatch.setattr(datum_sync_module, "_all_close_scaled_jit", None)
+        monkeypatch.setattr(datum_sync_module, "_count_not_scaled_jit", None)
+    assert datum_sync_module._is_scaled(zz, out_z, 0.3048) is expected
+
+
 init_error_data = [
     pytest.param(4326, None, None, id="CRS input only"),
     pytest.param(4326, 4269, 1, id="CRS (in and out) and transform input"),
@@ -161,6 +353,13 @@ def test_datum_sync_init__crs() -> None:
     )
 
 
+def test_datum_sync_init__shared_transformer() -> None:
+    """Instances built from the same EPSG pair share one cached transformer"""
+    first = DatumSync(crs_input=4326, crs_output=4269)
+    second = DatumSync(crs_input=4326, crs_output=4269)
+    assert first.transform is second.transform
+
+
 def test_datum_sync_init__transform() -> None:
     """Initialize with a transformer object"""
     transform = Transformer.from_crs(crs_from=CRS.from_epsg(4326), crs_to=CRS.from_epsg(4269), always_xy=True)
@@ -1,18 +1,26 @@
 """
 A file to create the coastal CSV intersection file based on the hydrofabric and coastal polygons
 
+Reading and the GeoParquet output require pyarrow (installed with the dev-examples extra).
+
 Example cmd:
-python tools/create_coastal_csv.py --gpkg conus_nextgen.gpkg --coastal-cw AtlGulf_InflowsOutflows_CCBuff.shp --file-name AtlGulf_hf_cross_walk
+python tools/create_coastal_csv.py --gpkg conus_nextgen.gpkg --coastal-cw AtlGulf_InflowsOutflows_CCBuff.shp --file-name AtlGulf_hf_cross_walk --csv
 """
 
 import argparse
 from pathlib import Path
 
 import geopandas as gpd
-from shapely.geometry import Point
+import pandas as pd
+
 
+def _sql_quote(value: object) -> str:
+    """Quote a value as an SQL string literal for an OGR where clause"""
+    escaped = str(value).replace("'", "''")
+    return f"'{escaped}'"
 
-def create_coastal_csv(gpkg: Path, coastal_cw: Path, file_name: str) -> None:
+
+def create_coastal_csv(gpkg: Path, coastal_cw: Path, file_name: str, csv: bool = False) -> None:
     """A script that converts the CW shape file points to contain latest HF IDs and attrs
 
     Parameters
@@ -22,43 +30,59 @@ def create_coastal_csv(gpkg: Path, coastal_cw: Path, file_name: str) -> None:
     coastal_cw : Path
         The path to the coastal polygons shp file
     file_name : str
-        The file name for the output csv and gpkg files
+        The file name for the output GeoParquet and csv files
+    csv : bool
+        Also write a csv copy of the output, by default False
     """
-    divide_attr = gpd.read_file(gpkg, layer="divide-attributes")
-    divides = gpd.read_file(gpkg, layer="divides")
-    coastal_gdf = gpd.read_file(coastal_cw)
+    # Arrow reads hand GDAL's columnar batches straight to geopandas instead of row by row
+    divides = gpd.read_file(gpkg, layer="divides", engine="pyogrio", use_arrow=True)
+    coastal_gdf = gpd.read_file(coastal_cw, engine="pyogrio", use_arrow=True)
 
     if divides.crs != coastal_gdf.crs:
         print("Reprojecting coastal bounds to match divides CRS")
         coastal_gdf = coastal_gdf.to_crs(divides.crs)
 
     print("Generating points from coastal polygon boundaries")
-    coastal_points = []
-
-    for idx, row in coastal_gdf.iterrows():
-        coastal_points.append(
-            {
-                "point_idx": idx,
-                "longitude": row["long"],
-                "latitude": row["lat"],
-                "geometry": Point(row["long"], row["lat"]),
-            }
-        )
-
-    coastal_points_gdf = gpd.GeoDataFrame(coastal_points, crs="EPSG:4326").to_crs(divides.crs)
+    lon = coastal_gdf["long"].to_numpy()
+    lat = coastal_gdf["lat"].to_numpy()
+    coastal_points_gdf = gpd.GeoDataFrame(
+        {"point_idx": coastal_gdf.index.to_numpy(), "longitude": lon, "latitude": lat},
+        geometry=gpd.points_from_xy(lon, lat),
+        crs="EPSG:4326",
+    ).to_crs(divides.crs)
     points_with_divides = gpd.sjoin(coastal_points_gdf, divides, how="left", predicate="within")
-    points_with_divides = points_with_divides.drop_duplicates("point_idx")
+    # the sjoin keeps the point index, so a point matching several divides is a repeated index label
+    points_with_divides = points_with_divides.loc[~points_with_divides.index.duplicated()]
     points_with_divides = points_with_divides.dropna(subset=["divide_id"])
 
+    # only the attributes of divides containing a coastal point are read, not the whole layer
+    needed = points_with_divides["divide_id"].unique()
+    divide_attr = gpd.read_file(
+        gpkg,
+        layer="divide-attributes",
+        engine="pyogrio",
+        use_arrow=True,
+        where=f"divide_id IN ({', '.join(map(_sql_quote, needed))})" if len(needed) else "0 = 1",
+    )
+
+    # join on shared integer category codes rather than hashing id strings; the where filter above
+    # leaves only attribute ids that are in needed
+    id_dtype = points_with_divides["divide_id"].dtype
+    ids = pd.CategoricalDtype(needed)
+    points_with_divides["divide_id"] = points_with_divides["divide_id"].astype(ids)
+    divide_attr["divide_id"] = divide_attr["divide_id"].astype(ids)
     merged_points = points_with_divides.merge(
         divide_attr,
         on="divide_id",
         how="left",
     )
-    results_df = merged_points.drop_duplicates().copy()
+    merged_points["divide_id"] = merged_points["divide_id"].astype(id_dtype)
+    # only repeated attribute rows can duplicate a point here; compare keys rather than every column
+    results_df = merged_points.drop_duplicates(subset=["point_idx", "divide_id"])
 
-    results_df.to_csv(Path.cwd() / f"{file_name}.csv", index=False)
-    results_df.to_file(Path.cwd() / f"{file_name}.gpkg", driver="GPKG")
+    results_df.to_parquet(Path.cwd() / f"{file_name}.parquet", compression="zstd", index=False)
+    if csv:
+        results_df.to_csv(Path.cwd() / f"{file_name}.csv", index=False, lineterminator="\n")
     print(f"Coastal summary saved to {file_name}")
 
 
@@ -83,8 +107,13 @@ if __name__ == "__main__":
         "--file-name",
         type=Path,
         required=True,
-        help="The file name for the output csv and gpkg files",
+        help="The file name for the output GeoParquet and csv files",
+    )
+    parser.add_argument(
+        "--csv",
+        action="store_true",
+        help="Also write the output as a csv file",
     )
 
     args = parser.parse_args()
-    create_coastal_csv(gpkg=args.gpkg, coastal_cw=args.coastal_cw, file_name=args.file_name)
+    create_coastal_csv(gpkg=args.gpkg, coastal_cw=args.coastal_cw, file_name=args.file_name, csv=args.csv)